@@ -1,8 +1,8 @@
+import functools
 import os
-from dataclasses import dataclass
-from typing import List
-
-import openai
+import sys
+from collections import deque
+from typing import Dict, Iterable
 
 SYSTEM_TEXT = """\
 You are a language learning assistant. You help people learn a new language \
@@ -14,6 +14,16 @@ and explain the correction right away. You never let them make the same mistake.
 Don't translate back to English unless requested. Always speak in the target language.
 """
 
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_TEXT}
+
+
+@functools.lru_cache(maxsize=8)
+def _assistant_preamble(lang: str) -> Dict[str, str]:
+    return {
+        "role": "assistant",
+        "content": f"Let's role play a conversation in {lang}! I'll correct grammar or spelling mistakes you make as soon as I see them.",
+    }
+
 
 def read_dotenv() -> None:
     """Read secrets from dotenv."""
@@ -21,26 +31,25 @@ def read_dotenv() -> None:
         return
 
     with open(".env", "r") as f:
-        for line in f:
-            key, value = line.strip().split("=", 1)
-            os.environ[key] = value
+        lines = f.read().splitlines()
 
-
-@dataclass
-class ChatMessage:
-    role: str
-    content: str
-
-    def to_dict(self):
-        return {"role": self.role, "content": self.content}
+    # Skip blank lines and comments
+    pairs = (
+        line.split("=", 1)
+        for line in map(str.strip, lines)
+        if line and not line.startswith("#")
+    )
+    os.environ.update({key.strip(): value.strip() for key, value in pairs})
 
 
 def suggest_chat_topic(lang: str) -> str:
     """Suggest a topic for the user to talk about."""
+    import openai
+
     response = openai.ChatCompletion.create(
         model="gpt-3.5-turbo",
         messages=[
-            {"role": "system", "content": SYSTEM_TEXT},
+            _SYSTEM_MSG,
             {
                 "role": "user",
                 "content": f"I want to learn {lang}! What should we talk about?",
@@ -50,45 +59,44 @@ def suggest_chat_topic(lang: str) -> str:
     return response["choices"][0]["message"]["content"]
 
 
-def stream_completion(lang: str, chat_history: List[ChatMessage]):
+def stream_completion(lang: str, chat_history: Iterable[Dict[str, str]]):
     """Stream chat completion responses from OpenAI."""
+    import openai
 
     yield from openai.ChatCompletion.create(
         model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": SYSTEM_TEXT},
-            {
-                "role": "assistant",
-                "content": f"Let's role play a conversation in {lang}! I'll correct grammar or spelling mistakes you make as soon as I see them.",
-            },
-        ]
-        + [m.to_dict() for m in chat_history],
+        messages=[_SYSTEM_MSG, _assistant_preamble(lang), *chat_history],
         stream=True,
     )
 
 
 if __name__ == "__main__":
+    import openai
+
     read_dotenv()
     openai.api_key = os.environ["OPENAI_API_KEY"]
 
     lang = "German"
     topic = suggest_chat_topic(lang)
-    chat_history = [ChatMessage(role="assistant", content=topic)]
+    chat_history = deque([{"role": "assistant", "content": topic}], maxlen=10)
     print(f"<< {topic}")
 
+    write, flush = sys.stdout.write, sys.stdout.flush
+
     while True:
         user_input = input(">> ")
-        chat_history.append(ChatMessage(role="user", content=user_input))
+        chat_history.append({"role": "user", "content": user_input})
 
-        assistant_message = ""
-        print("<< ", end="")
+        assistant_parts = []
+        write("<< ")
         for chunk in stream_completion(lang, chat_history):
-            chunk_message = chunk["choices"][0]["delta"]
+            content = chunk["choices"][0]["delta"].get("content")
 
-            if "content" in chunk_message:
-                print(chunk_message["content"], end="")
-                assistant_message += chunk_message["content"]
-        print("")
+            if content:
+                write(content)
+                flush()
+                assistant_parts.append(content)
+        write("\n")
+        flush()
 
-        chat_history.append(ChatMessage(role="assistant", content=assistant_message))
-        chat_history = chat_history[-10:]
+        chat_history.append({"role": "assistant", "content": "".join(assistant_parts)})
@@ -16,8 +16,9 @@ class Symbol(str):
 
     @classmethod
     def intern(cls, name):
-        sym = cls.interned.get(name, Symbol(name))
-        cls.interned[name] = sym
+        sym = cls.interned.get(name)
+        if sym is None:
+            sym = cls.interned[name] = Symbol(name)
         return sym
 
     def __str__(self):
@@ -27,18 +28,21 @@ class Symbol(str):
         return '#<%s>' % self
 
 
-class Scope(dict):
+_MISSING = object()
+
+
+class Scope(object):
     def __init__(self, params=(), args=(), parent=None, git=None):
         self.parent = parent
         self.git_scope = git
         self.modules = {}
 
         if isinstance(params, Symbol):
-            self.update({params: list(args)})
+            self.bindings = {params: list(args)}
 
         else:
             assert len(params) == len(args)
-            self.update(zip(params, args))
+            self.bindings = dict(zip(params, args))
 
     def get_git_scope(self):
         if self.git_scope is not None:
@@ -48,18 +52,25 @@ class Scope(dict):
             return self.parent.get_git_scope()
 
     def find(self, ident, module=None):
-        if not module and ident in self:
-            return self[ident]
+        scope = self
+
+        while True:
+            if not module:
+                val = scope.bindings.get(ident, _MISSING)
+                if val is not _MISSING:
+                    return val
+
+            elif module in scope.modules:
+                return scope.modules[module].find(ident)
 
-        elif module in self.modules:
-            return self.modules[module].find(ident)
+            if scope.parent is None:
+                break
 
-        elif self.parent is not None:
-            return self.parent.find(ident, module)
+            scope = scope.parent
 
-        elif not module and self.git_scope is not None:
-            exp = self.git_scope.find(ident)
-            return eval_exp(exp, self)
+        if not module and scope.git_scope is not None:
+            exp = scope.git_scope.find(ident)
+            return eval_exp(exp, scope)
 
         raise LookupError(ident)
 
@@ -68,10 +79,10 @@ def make_global_scope(repo_path, fname):
     git = GitScope(repo_path, fname)
     global_scope = Scope(git=git)
 
-    global_scope.update({
+    global_scope.bindings.update({
         '+': lambda *args: sum(args),
         '-': op.sub,
-        '*': lambda *args: reduce(lambda a, b: a*b, args, 1),
+        '*': lambda *args: reduce(op.mul, args, 1),
         '/': op.div,
         'not': op.not_,
         '>': op.gt,
@@ -138,28 +149,46 @@ class Lambda(object):
 
 EOF = Symbol('#<eof>')
 
+# Builtin form names, interned once so eval_exp can compare with `is`.
+_IF = Symbol.intern('if')
+_LAMBDA = Symbol.intern('lambda')
+_QUOTE = Symbol.intern('quote')
+_STASH = Symbol.intern('stash!')
+_POP = Symbol.intern('pop!')
+_COMMIT = Symbol.intern('commit!')
+_USE = Symbol.intern('use')
 
-def tokenize(buf):
-    tokenizer = r'''^\s*([(')]|"(?:[^"])*"|;.*|[^\s('"`;)]+)(.*)'''
 
-    line = ''
+# Each alternative starts with a distinct set of characters, so a match
+# never has to backtrack into another branch.
+_TOKEN_RE = re.compile(r'''\s*([(')]|"[^"]*"|;.*|[^\s('"`;)]+)''')
+
+
+def tokenize(buf):
+    # Reads a line at a time (rather than the whole buffer) so the REPL can
+    # stream from stdin, but walks each line by offset instead of re-slicing.
+    line, pos = '', 0
 
     while True:
         if not buf:
             break
 
-        if line == '':
-            line = buf.readline()
+        match = _TOKEN_RE.match(line, pos)
+        if not match:
+            # Only unparseable input ends the stream; blank lines and
+            # trailing whitespace just move on to the next line.
+            if line[pos:].strip():
+                break
 
-        if line == '':
-            break
+            line, pos = buf.readline(), 0
+            if line == '':
+                break
 
-        match = re.match(tokenizer, line)
-        if not match:
-            break
+            continue
 
-        token, line = match.groups()
-        if token != '' and not token.startswith(';'):
+        pos = match.end()
+        token = match.group(1)
+        if not token.startswith(';'):
             yield token
 
     yield EOF
@@ -184,32 +213,46 @@ def atom(tok):
 
 
 def parse(tokens):
-    def handle_tok(tok):
-        if tok == '(':
-            lst = []
-
-            for tok in tokens:
-                if tok == ')':
-                    return lst
-                elif tok == EOF:
-                    raise SyntaxError('expected )')
-                else:
-                    lst.append(handle_tok(tok))
+    # Open lists are kept on an explicit stack rather than recursing per
+    # nesting level. A pending quote is marked with None and wraps the next
+    # complete expression.
+    stack = []
 
-        elif tok == ')':
-            raise SyntaxError('unmatched )')
+    for tok in tokens:
+        if tok is EOF:
+            if not stack:
+                return EOF
+
+            raise SyntaxError('unexpected EOF' if stack[-1] is None
+                              else 'expected )')
+
+        elif tok == '(':
+            stack.append([])
+            continue
 
         elif tok == "'":
-            return [Symbol.intern('quote'), handle_tok(next(tokens))]
+            stack.append(None)
+            continue
+
+        elif tok == ')':
+            if not stack or stack[-1] is None:
+                raise SyntaxError('unmatched )')
 
-        elif tok == EOF:
-            raise SyntaxError('unexpected EOF')
+            exp = stack.pop()
 
         else:
-            return atom(tok)
+            exp = atom(tok)
+
+        while stack and stack[-1] is None:
+            stack.pop()
+            exp = [_QUOTE, exp]
+
+        if not stack:
+            return exp
+
+        stack[-1].append(exp)
 
-    tok = next(tokens)
-    return EOF if tok is EOF else handle_tok(tok)
+    return EOF
 
 
 def unparse(ast):
@@ -237,70 +280,90 @@ def read(string):
     return parse(tokenize(io))
 
 
-def eval_exp(exp, scope):
-    if isinstance(exp, Symbol):
-        module, ident = exp.split('.', 1) if '.' in exp else (None, exp)
-        return scope.find(ident, module)
+def _eval_if(args, scope):
+    (cond, then, else_) = args
+    branch = then if eval_exp(cond, scope) else else_
 
-    # atoms unevaluated
-    elif not isinstance(exp, list):
-        return exp
+    return eval_exp(branch, scope)
 
-    # evaluate function call
-    fn_atom, args = exp[0], exp[1:]
 
-    # builtin forms
-    if fn_atom is Symbol.intern('if'):
-        (cond, then, else_) = args
-        branch = then if eval_exp(cond, scope) else else_
+def _eval_lambda(args, scope):
+    (params, body) = args
+    return Lambda(params, body, scope)
 
-        return eval_exp(branch, scope)
 
-    elif fn_atom is Symbol.intern('lambda'):
-        (params, body) = args
-        return Lambda(params, body, scope)
+def _eval_quote(args, scope):
+    if len(args) == 1:
+        return args[0]
 
-    elif fn_atom is Symbol.intern('quote'):
-        if len(args) == 1:
-            return args[0]
+    return args
 
-        return args
 
-    elif fn_atom is Symbol.intern('stash!'):
-        # TODO: this should modify the file and then git stash
-        # TODO: (stash! (lambda (x) (x + 1)))
-        pass
+def _eval_stash(args, scope):
+    # TODO: this should modify the file and then git stash
+    # TODO: (stash! (lambda (x) (x + 1)))
+    pass
 
-    elif fn_atom is Symbol.intern('pop!'):
-        # TODO: this should pop the stash and return the parsed AST
-        # TODO: (eval (pop!))
-        pass
 
-    elif fn_atom is Symbol.intern('commit!'):
-        # TODO: this should apply a commit on top of the named branch.
-        # TODO: (commit! 'fn/add-1 (lambda (x) (x + 1)))
+def _eval_pop(args, scope):
+    # TODO: this should pop the stash and return the parsed AST
+    # TODO: (eval (pop!))
+    pass
 
-        (branch, code) = map(lambda x: eval_exp(x, scope), args)
 
-        assert isinstance(branch, str)
+def _eval_commit(args, scope):
+    # TODO: this should apply a commit on top of the named branch.
+    # TODO: (commit! 'fn/add-1 (lambda (x) (x + 1)))
 
-        git = scope.get_git_scope()
-        return git.commit(branch, unparse(code))
+    (branch, code) = map(lambda x: eval_exp(x, scope), args)
 
-    elif fn_atom is Symbol.intern('use'):
-        # TODO: (use "/path/to/repo" 'name)
-        # TODO: (lib.foo 1 2) => looks in 'lib' library for ident "foo"
-        (repo_path, name) = map(lambda x: eval_exp(x, scope), args)
+    assert isinstance(branch, str)
 
-        scope.modules[name] = make_global_scope(repo_path, 'warp.lisp')
-        return name
+    git = scope.get_git_scope()
+    return git.commit(branch, unparse(code))
 
-    else:
-        exps = [eval_exp(e, scope) for e in exp]
-        fn, args = exps[0], exps[1:]
 
-        if isinstance(fn, Lambda):
-            scope = Scope(fn.params, args, fn.scope)
-            return fn(*args)
-        else:
-            return fn(*args)
+def _eval_use(args, scope):
+    # TODO: (use "/path/to/repo" 'name)
+    # TODO: (lib.foo 1 2) => looks in 'lib' library for ident "foo"
+    (repo_path, name) = map(lambda x: eval_exp(x, scope), args)
+
+    scope.modules[name] = make_global_scope(repo_path, 'warp.lisp')
+    return name
+
+
+# builtin forms
+_SPECIAL_FORMS = {
+    _IF: _eval_if,
+    _LAMBDA: _eval_lambda,
+    _QUOTE: _eval_quote,
+    _STASH: _eval_stash,
+    _POP: _eval_pop,
+    _COMMIT: _eval_commit,
+    _USE: _eval_use,
+}
+
+
+def eval_exp(exp, scope):
+    if isinstance(exp, Symbol):
+        module, ident = exp.split('.', 1) if '.' in exp else (None, exp)
+        return scope.find(ident, module)
+
+    # atoms unevaluated
+    elif not isinstance(exp, list):
+        return exp
+
+    # evaluate function call
+    fn_atom, args = exp[0], exp[1:]
+
+    form = _SPECIAL_FORMS.get(fn_atom) if isinstance(fn_atom, Symbol) else None
+    if form is not None:
+        return form(args, scope)
+
+    exps = [eval_exp(e, scope) for e in exp]
+    fn, args = exps[0], exps[1:]
+
+    if isinstance(fn, Lambda):
+        return eval_exp(fn.body, Scope(fn.params, args, fn.scope))
+    else:
+        return fn(*args)
@@ -66,12 +66,29 @@ class Registry:
 
     @staticmethod
     def register(rule):
-        meta = rule.meta()
-        name = meta['name']
+        """
+        Register a rule under its metadata name. When the rule uses the
+        default `Rule.meta`, that name is the class name, so computing the
+        rest of the metadata is deferred until it's requested.
+        """
+        entry = {'class': rule}
+
+        if getattr(rule.meta, '__func__', None) is Rule.meta.__func__:
+            name = rule.__name__
+        else:
+            entry['meta'] = rule.meta()
+            name = entry['meta']['name']
 
         logger.debug('registering rule "%s"', name)
 
-        Registry._REGISTRY[name] = {'class': rule, 'meta': meta}
+        Registry._REGISTRY[name] = entry
+
+    @staticmethod
+    def _with_meta(entry):
+        if 'meta' not in entry:
+            entry['meta'] = entry['class'].meta()
+
+        return entry
 
     @staticmethod
     def get_meta(name):
@@ -79,7 +96,7 @@ class Registry:
         if name not in Registry._REGISTRY:
             raise UnknownRuleException(name)
 
-        return Registry._REGISTRY[name]
+        return Registry._with_meta(Registry._REGISTRY[name])
 
     @staticmethod
     def all():
@@ -87,7 +104,7 @@ class Registry:
         Return an iterator over all known Rule metadata. Equivalent to calling
         `Registry.get(name)` for all registered rules.
         """
-        return Registry._REGISTRY.values()
+        return map(Registry._with_meta, Registry._REGISTRY.values())
 
 
 class Rule:
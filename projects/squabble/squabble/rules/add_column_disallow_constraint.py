@@ -40,24 +40,32 @@ class AddColumnDisallowConstraints(Rule):
         'constraint_not_allowed': 'column "{col}" has a disallowed constraint'
     }
 
-    def enable(self, ctx):
-        disallowed = self._options.get('disallowed', [])
+    def __init__(self, opts):
+        disallowed = opts.get('disallowed', [])
         if disallowed == []:
             raise RuleConfigurationException(self, 'must specify `disallowed` constraints')
 
+        # A single file-level option value is parsed as a bare string
+        if isinstance(disallowed, str):
+            disallowed = [disallowed]
+
+        constraint_map = self.CONSTRAINT_MAP
         constraints = set()
 
         for c in disallowed:
-            ty = self.CONSTRAINT_MAP[c.upper()]
-            if ty is None:
+            try:
+                ty = constraint_map[c.upper()]
+            except KeyError:
                 raise RuleConfigurationException(self, 'unknown constraint: `%s`' % c)
 
-            constraints.add(ty)
+            constraints.add(int(ty))
 
-        ctx.register('AlterTableCmd', self._check(constraints))
+        self._blocked_constraints = frozenset(constraints)
 
-    @Rule.node_visitor
-    def _check(self, ctx, node, disallowed_constraints):
+    def enable(self, ctx):
+        ctx.register('AlterTableCmd', self._check)
+
+    def _check(self, ctx, node):
         """
         Node is an `AlterTableCmd`:
 
@@ -77,15 +85,20 @@ class AddColumnDisallowConstraints(Rule):
         if node.subtype != AlterTableType.AT_AddColumn:
             return
 
-        constraints = node['def'].constraints
+        col_def = node['def']
+        constraints = col_def.constraints
 
         # No constraints imposed, nothing to do.
         if constraints == pglast.Missing:
             return
 
+        blocked = self._blocked_constraints
+        col = None
+
         for constraint in constraints:
-            if constraint.contype.value in disallowed_constraints:
-                col = node['def'].colname.value
+            if constraint.contype.value in blocked:
+                if col is None:
+                    col = col_def.colname.value
 
                 ctx.report(
                     self,
@@ -25,7 +25,7 @@ class DisallowChangeColumnType(Rule):
         self._opts = opts
 
     def enable(self, ctx):
-        ctx.register('AlterTableCmd', lambda c, n: self._check(c, n))
+        ctx.register('AlterTableCmd', self._check)
 
     def _check(self, ctx, node):
         """
@@ -24,7 +24,7 @@ class DisallowRenameEnumValue(Rule):
         self._opts = opts
 
     def enable(self, ctx):
-        ctx.register('AlterEnumStmt', lambda c, n: self._check_enum(c, n))
+        ctx.register('AlterEnumStmt', self._check_enum)
 
     def _check_enum(self, ctx, node):
         """
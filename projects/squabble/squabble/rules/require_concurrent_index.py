@@ -37,9 +37,9 @@ class RequireConcurrentIndex(Rule):
         # Keep track of CREATE TABLE statements if we're not including
         # them in our check.
         if not self._include_new:
-            ctx.register('CreateStmt', lambda c, n: self._create_table(c, n))
+            ctx.register('CreateStmt', self._create_table)
 
-        ctx.register('IndexStmt', lambda c, n: self._create_index(c, n))
+        ctx.register('IndexStmt', self._create_index)
 
     def _create_table(self, ctx, node):
         table = node.relation.relname.value.lower()
@@ -27,7 +27,7 @@ class RequirePrimaryKey(Rule):
         self._seen_pk = False
 
     def enable(self, ctx):
-        ctx.register('CreateStmt', lambda c, n: self._create_table(c, n))
+        ctx.register('CreateStmt', self._create_table)
 
     def _create_table(self, ctx, node):
         self._table = node
@@ -47,7 +47,7 @@ class RequirePrimaryKey(Rule):
         ctx.register('ColumnDef', _check_column)
         ctx.register('Constraint', _check_constraint)
 
-        ctx.register_exit(lambda c: self._check_pk(c))
+        ctx.register_exit(self._check_pk)
 
     def _check_pk(self, ctx):
         """
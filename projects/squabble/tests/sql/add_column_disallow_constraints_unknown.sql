@@ -0,0 +1,4 @@
+-- enable:AddColumnDisallowConstraints disallowed=BOGUS
+-- >>> {"line": 1, "column": 0, "severity": "ERROR", "message_formatted": "unknown constraint: `BOGUS`"}
+
+ALTER TABLE foobar ADD COLUMN colname coltype DEFAULT baz;
@@ -0,0 +1,45 @@
+import pytest
+
+from squabble import UnknownRuleException
+from squabble.rules import Registry, Rule
+
+
+def test_register_default_meta():
+    class DefaultMetaRule(Rule):
+        """
+        Short description
+
+        Longer help text.
+        """
+
+    meta = Registry.get_meta('DefaultMetaRule')
+
+    assert meta['class'] is DefaultMetaRule
+    assert meta['meta']['name'] == 'DefaultMetaRule'
+    assert meta['meta']['description'] == 'Short description'
+
+
+def test_register_classmethod_meta():
+    class ClassMethodMetaRule(Rule):
+        @classmethod
+        def meta(cls):
+            return {'name': 'classmethod-rule', 'description': '', 'help': None}
+
+    meta = Registry.get_meta('classmethod-rule')
+    assert meta['class'] is ClassMethodMetaRule
+
+    with pytest.raises(UnknownRuleException):
+        Registry.get_meta('ClassMethodMetaRule')
+
+
+def test_register_staticmethod_meta():
+    class StaticMethodMetaRule(Rule):
+        @staticmethod
+        def meta():
+            return {'name': 'staticmethod-rule', 'description': '', 'help': None}
+
+    meta = Registry.get_meta('staticmethod-rule')
+    assert meta['class'] is StaticMethodMetaRule
+
+    with pytest.raises(UnknownRuleException):
+        Registry.get_meta('StaticMethodMetaRule')